@@ -90,6 +90,15 @@ WEIGHTS_SUM = sum(w for w in ACTION_WEIGHTS.values() if w > 0)
 NEGATIVE_WEIGHTS_SUM = sum(abs(w) for w in ACTION_WEIGHTS.values() if w < 0)
 NEGATIVE_SCORES_OFFSET = NEGATIVE_WEIGHTS_SUM / max(WEIGHTS_SUM, 1)
 
+# (action, weight) in ACTIONS order, with and without VQV eligibility.
+# VQV weight eligibility (weighted_scorer.rs:72-81): no media → vqv weight = 0
+_WEIGHT_ROWS_MEDIA: tuple[tuple[str, float], ...] = tuple(
+    (a, ACTION_WEIGHTS.get(a, 0.0)) for a in ACTIONS
+)
+_WEIGHT_ROWS_NO_MEDIA: tuple[tuple[str, float], ...] = tuple(
+    (a, 0.0 if a == "vqv_score" else w) for a, w in _WEIGHT_ROWS_MEDIA
+)
+
 
 def compute_weighted_score(scores: dict[str, float],
                            has_media: bool = False) -> float:
@@ -103,13 +112,9 @@ def compute_weighted_score(scores: dict[str, float],
     if no video/media, vqv_score weight is set to 0.
     """
     total = 0.0
-    for action in ACTIONS:
-        score = scores.get(action, 0.0)
-        weight = ACTION_WEIGHTS.get(action, 0.0)
-        # VQV weight eligibility: no media → vqv weight = 0
-        if action == "vqv_score" and not has_media:
-            weight = 0.0
-        total += score * weight
+    get = scores.get
+    for action, weight in (_WEIGHT_ROWS_MEDIA if has_media else _WEIGHT_ROWS_NO_MEDIA):
+        total += get(action, 0.0) * weight
     return offset_score(total)
 
 
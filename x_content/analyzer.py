@@ -21,6 +21,18 @@ _CTA_PATTERNS_TR = [
     r"\byorum\b", r"\bdene\b", r"\boku\b", r"\byaz\b",
 ]
 
+_CTA_RES_EN = [re.compile(p) for p in _CTA_PATTERNS_EN]
+_CTA_RES_TR = [re.compile(p) for p in _CTA_PATTERNS_TR]
+
+# Structural patterns
+_HASHTAG_RE = re.compile(r"#\w+")
+_URL_RE = re.compile(r"https?://\S+")
+_NUMBER_RE = re.compile(r"\d+%?")
+_LIST_LINE_RE = re.compile(r"^\s*[\d•\-\*►▸→]\s*")
+_EMOJI_RE = re.compile(
+    r"[\U0001f300-\U0001f9ff\U00002600-\U000027bf\U0000fe00-\U0000feff]"
+)
+
 # Emotional/power words
 _POWER_WORDS_EN = [
     "secret", "shocking", "truth", "mistake", "wrong", "never",
@@ -67,10 +79,10 @@ def analyze(text: str, has_media: bool = False) -> dict:
     word_count = len(text.split())
 
     # Hashtags
-    hashtags = re.findall(r"#\w+", text)
+    hashtags = _HASHTAG_RE.findall(text)
 
     # URLs
-    has_url = bool(re.search(r"https?://\S+", text))
+    has_url = bool(_URL_RE.search(text))
 
     # Questions
     questions = text.count("?")
@@ -84,25 +96,23 @@ def analyze(text: str, has_media: bool = False) -> dict:
 
     # CTA detection
     lower_text = text.lower()
-    cta_patterns = _CTA_PATTERNS_TR if lang == "tr" else _CTA_PATTERNS_EN
-    cta_matches = [p for p in cta_patterns if re.search(p, lower_text)]
+    cta_patterns = _CTA_RES_TR if lang == "tr" else _CTA_RES_EN
+    cta_matches = [p for p in cta_patterns if p.search(lower_text)]
 
     # Power words
     power_words = _POWER_WORDS_TR if lang == "tr" else _POWER_WORDS_EN
     found_power = [w for w in power_words if w in lower_text]
 
     # Numbers / data
-    has_numbers = bool(re.search(r"\d+%?", text))
+    has_numbers = bool(_NUMBER_RE.search(text))
 
     # List format (numbered or bulleted lines)
-    list_lines = [l for l in lines if re.match(r"^\s*[\d•\-\*►▸→]\s*", l)]
+    list_lines = [l for l in lines if _LIST_LINE_RE.match(l)]
     has_list = len(list_lines) >= 2
 
     # Emojis (rough count via Unicode range)
-    emoji_count = len(re.findall(
-        r"[\U0001f300-\U0001f9ff\U00002600-\U000027bf\U0000fe00-\U0000feff]",
-        text
-    ))
+    # Every emoji range is non-ASCII, so ASCII text needs no regex scan
+    emoji_count = 0 if text.isascii() else len(_EMOJI_RE.findall(text))
 
     return {
         "char_count": char_count,
@@ -126,3 +136,11 @@ def analyze(text: str, has_media: bool = False) -> dict:
         "has_list_format": has_list,
         "emoji_count": emoji_count,
     }
+
+
+def analyze_batch(texts: list[str], has_media: bool = False) -> list[dict]:
+    """Analyze several tweets in one call.
+
+    Returns one feature dictionary per text, in input order.
+    """
+    return [analyze(text, has_media=has_media) for text in texts]
@@ -5,6 +5,7 @@ Uses ANSI colors, dynamic terminal width, and clean formatting
 that makes tweet text easily copyable.
 """
 
+import json
 import shutil
 import textwrap
 
@@ -65,6 +66,8 @@ def _get_width() -> int:
 def _bar(value: float, width: int = 20) -> str:
     """Render a colored progress bar."""
     cfg_width = config.get("display", {}).get("bar_width", width)
+    if cfg_width <= 0:
+        return ""
     filled = int(value * cfg_width)
     empty = cfg_width - filled
 
@@ -81,6 +84,8 @@ def _bar(value: float, width: int = 20) -> str:
 def _bar_negative(value: float, width: int = 20) -> str:
     """Render a progress bar for negative signals (lower is better)."""
     cfg_width = config.get("display", {}).get("bar_width", width)
+    if cfg_width <= 0:
+        return ""
     filled = int(value * cfg_width)
     empty = cfg_width - filled
 
@@ -157,6 +162,7 @@ def _wrap_text(text: str, width: int, indent: int = 4) -> list[str]:
 def render_preserve_style(result: dict) -> str:
     """Render Phase 1 result: original vs same-style optimized tweet."""
     w = _get_width()
+    divider = _divider(w)
     parts = []
 
     # Header
@@ -196,7 +202,7 @@ def render_preserve_style(result: dict) -> str:
     # ── Signal Profile (compact) ──
     parts.append("")
     parts.append(_section_title("Signal Profile"))
-    parts.append(_divider(w))
+    parts.append(divider)
 
     display_cfg = config.get("display", {})
     show_all = display_cfg.get("show_all_signals", False)
@@ -253,7 +259,7 @@ def render_preserve_style(result: dict) -> str:
     if comparison:
         parts.append("")
         parts.append(_section_title("Signal Changes"))
-        parts.append(_divider(w))
+        parts.append(divider)
 
         delta = comparison["delta"]
         sorted_actions = sorted(
@@ -287,12 +293,12 @@ def render_preserve_style(result: dict) -> str:
     if claude_analysis:
         parts.append("")
         parts.append(_section_title("Analysis"))
-        parts.append(_divider(w))
+        parts.append(divider)
         for line in _wrap_text(claude_analysis, w - 4):
             parts.append(f"    {DIM}{line}{RESET}")
 
     parts.append("")
-    parts.append(f"  {GRAY}{'─' * (w - 4)}{RESET}")
+    parts.append(divider)
     parts.append("")
 
     return "\n".join(parts)
@@ -310,6 +316,7 @@ def render_variation_card(
 ) -> str:
     """Render a single variation as a clean card."""
     w = _get_width()
+    divider = _divider(w)
     parts = []
 
     tweet = variation.get("tweet", "")
@@ -330,7 +337,7 @@ def render_variation_card(
     # Card header
     parts.append("")
     parts.append(f"  {BOLD}{BRIGHT_MAGENTA}[{index}]{RESET} {BOLD}{WHITE}{strategy}{RESET}  {change_color}{opt_ws:.1f} ({change_str}){RESET}")
-    parts.append(_divider(w))
+    parts.append(divider)
     parts.append("")
 
     # Tweet text — clean and copyable
@@ -379,6 +386,7 @@ def render_variation_card(
 def render_variations(result: dict, verbose: bool = False) -> str:
     """Render Phase 2: all style variations."""
     w = _get_width()
+    divider = _divider(w)
     parts = []
 
     parts.append("")
@@ -419,7 +427,7 @@ def render_variations(result: dict, verbose: bool = False) -> str:
         parts.append(f"  {GRAY}{ITALIC}Analysis: {result['claude_analysis']}{RESET}")
 
     parts.append("")
-    parts.append(f"  {GRAY}{'─' * (w - 4)}{RESET}")
+    parts.append(divider)
     parts.append("")
 
     return "\n".join(parts)
@@ -436,7 +444,6 @@ def render_full(result: dict, verbose: bool = False) -> str:
 
 def render_json(result: dict) -> str:
     """Render result as JSON string."""
-    import json
     output = {
         "original": {
             "tweet": result["tweet"],
@@ -470,16 +477,20 @@ def render_json(result: dict) -> str:
 def render_profile_summary(profile: dict) -> str:
     """Render a user profile summary for terminal display."""
     w = _get_width()
+    divider = _divider(w)
     parts = []
 
-    username = profile.get("username", "unknown")
-    followers = profile.get("followers", 0)
-    following = profile.get("following", 0)
-    tweet_count = profile.get("tweet_count", 0)
-    verified = profile.get("verified", False)
-    engagement = profile.get("engagement", {})
-    style = profile.get("style", {})
-    topics = profile.get("topics", [])
+    pg = profile.get
+    username = pg("username", "unknown")
+    followers = pg("followers", 0)
+    following = pg("following", 0)
+    tweet_count = pg("tweet_count", 0)
+    verified = pg("verified", False)
+    engagement = pg("engagement", {})
+    style = pg("style", {})
+    topics = pg("topics", [])
+    eg = engagement.get
+    sg = style.get
 
     # Format followers
     if followers >= 1_000_000:
@@ -506,16 +517,16 @@ def render_profile_summary(profile: dict) -> str:
     )
 
     # Engagement metrics
-    avg_likes = engagement.get("avg_likes", 0)
-    avg_rts = engagement.get("avg_retweets", 0)
-    avg_replies = engagement.get("avg_replies", 0)
-    avg_quotes = engagement.get("avg_quotes", 0)
-    er_likes = engagement.get("engagement_rate_likes", 0)
-    er_rts = engagement.get("engagement_rate_retweets", 0)
+    avg_likes = eg("avg_likes", 0)
+    avg_rts = eg("avg_retweets", 0)
+    avg_replies = eg("avg_replies", 0)
+    avg_quotes = eg("avg_quotes", 0)
+    er_likes = eg("engagement_rate_likes", 0)
+    er_rts = eg("engagement_rate_retweets", 0)
 
     parts.append("")
     parts.append(_section_title("Engagement (per tweet)"))
-    parts.append(_divider(w))
+    parts.append(divider)
     parts.append(
         f"    {GRAY}Likes:{RESET} {GREEN}{avg_likes:.1f}{RESET}  "
         f"{GRAY}RTs:{RESET} {CYAN}{avg_rts:.1f}{RESET}  "
@@ -528,9 +539,9 @@ def render_profile_summary(profile: dict) -> str:
     )
 
     # Style info
-    tone = style.get("typical_tone", "neutral")
-    avg_len = style.get("avg_tweet_length", 0)
-    avg_emoji = style.get("emoji_frequency", 0)
+    tone = sg("typical_tone", "neutral")
+    avg_len = sg("avg_tweet_length", 0)
+    avg_emoji = sg("emoji_frequency", 0)
 
     parts.append("")
     parts.append(
@@ -544,7 +555,7 @@ def render_profile_summary(profile: dict) -> str:
         topic_str = ", ".join(topics[:6])
         parts.append(f"  {GRAY}Topics:{RESET} {CYAN}{topic_str}{RESET}")
 
-    parts.append(f"  {GRAY}{'─' * (w - 4)}{RESET}")
+    parts.append(divider)
     parts.append("")
 
     return "\n".join(parts)
@@ -558,6 +569,7 @@ def render_discovery_result(result: dict) -> str:
     and signal scores.
     """
     w = _get_width()
+    divider = _divider(w)
     parts = []
 
     trending = result.get("trending_topic", {})
@@ -625,7 +637,7 @@ def render_discovery_result(result: dict) -> str:
     if "scores" in optimized:
         parts.append("")
         parts.append(_section_title("Signal Scores"))
-        parts.append(_divider(w))
+        parts.append(divider)
 
         display_cfg = config.get("display", {})
         top_n = display_cfg.get("top_signals_count", 8)
@@ -659,7 +671,7 @@ def render_discovery_result(result: dict) -> str:
     if claude_analysis:
         parts.append("")
         parts.append(_section_title("Analysis"))
-        parts.append(_divider(w))
+        parts.append(divider)
         for line in _wrap_text(claude_analysis, w - 4):
             parts.append(f"    {DIM}{line}{RESET}")
 
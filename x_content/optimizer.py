@@ -14,7 +14,9 @@ from x_content.prompts import (
     build_full_prompt, build_preserve_style_prompt,
     build_refine_prompt, build_discovery_tweet_prompt,
 )
-from x_content.scorer import score_tweet, comparison_report, adjust_scores_for_profile
+from x_content.scorer import (
+    score_tweet, full_score_report, comparison_report, adjust_scores_for_profile,
+)
 from x_content import config
 
 
@@ -22,17 +24,35 @@ class OptimizationError(Exception):
     pass
 
 
-def call_claude(prompt: str, timeout: int | None = None) -> str:
+def call_claude(
+    prompt: str, timeout: int | None = None, system: str | None = None,
+) -> str:
     """Call Claude Code CLI and return the response text.
 
-    Uses: claude -p "<prompt>" --output-format json
+    Uses: claude -p --output-format json [--system-prompt "<system>"] < prompt
+
+    The system prompt (including any author profile context) goes in the
+    system slot, where the CLI caches it across calls. It is passed as a
+    command-line argument, so it is visible in the process list; the
+    per-tweet user prompt is written to stdin and is not.
+
+    Args:
+        prompt: User prompt, sent on stdin.
+        timeout: Seconds to wait; defaults to `claude.timeout` in config.
+        system: Optional system prompt, e.g. the first half of a
+            `build_*_prompt` result.
     """
     if timeout is None:
         timeout = config.get("claude", {}).get("timeout", 120)
 
+    cmd = ["claude", "-p", "--output-format", "json"]
+    if system:
+        cmd += ["--system-prompt", system]
+
     try:
         result = subprocess.run(
-            ["claude", "-p", prompt, "--output-format", "json"],
+            cmd,
+            input=prompt,
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -153,7 +173,7 @@ def optimize(
         original_scores = adjust_scores_for_profile(original_scores, user_profile)
 
     # Step 3: Build prompt
-    prompt = build_full_prompt(
+    system, prompt = build_full_prompt(
         tweet=tweet,
         analysis=analysis,
         scores=original_scores,
@@ -167,7 +187,7 @@ def optimize(
     )
 
     # Step 4: Call Claude
-    raw_response = call_claude(prompt)
+    raw_response = call_claude(prompt, system=system)
 
     # Step 5: Parse and validate
     data = parse_response(raw_response)
@@ -187,19 +207,17 @@ def optimize(
             for action in ACTIONS:
                 var["scores"].setdefault(action, 0.0)
 
-    # Step 6: Generate comparison reports
+    # Step 6: Generate comparison reports (original is scored once)
+    original_report = full_score_report(analysis, has_media=has_media)
     comparisons = []
     for var in data["variations"]:
         if "scores" in var:
-            comp = comparison_report(analysis, var["scores"], has_media=has_media)
+            comp = comparison_report(analysis, var["scores"], has_media=has_media,
+                                     original_report=original_report)
             comparisons.append(comp)
         else:
             comparisons.append(None)
 
-    # Build original report
-    from x_content.scorer import full_score_report
-    original_report = full_score_report(analysis, has_media=has_media)
-
     return {
         "tweet": tweet,
         "analysis": analysis,
@@ -238,7 +256,7 @@ def optimize_preserve_style(
         original_scores = adjust_scores_for_profile(original_scores, user_profile)
 
     # Step 3: Build preserve-style prompt
-    prompt = build_preserve_style_prompt(
+    system, prompt = build_preserve_style_prompt(
         tweet=tweet,
         analysis=analysis,
         scores=original_scores,
@@ -250,7 +268,7 @@ def optimize_preserve_style(
     )
 
     # Step 4: Call Claude
-    raw_response = call_claude(prompt)
+    raw_response = call_claude(prompt, system=system)
 
     # Step 5: Parse and validate
     data = parse_response(raw_response)
@@ -269,12 +287,11 @@ def optimize_preserve_style(
             var["scores"].setdefault(action, 0.0)
 
     # Step 6: Generate comparison
+    original_report = full_score_report(analysis, has_media=has_media)
     comp = None
     if "scores" in var:
-        comp = comparison_report(analysis, var["scores"], has_media=has_media)
-
-    from x_content.scorer import full_score_report
-    original_report = full_score_report(analysis, has_media=has_media)
+        comp = comparison_report(analysis, var["scores"], has_media=has_media,
+                                 original_report=original_report)
 
     return {
         "tweet": tweet,
@@ -308,7 +325,7 @@ def refine_tweet(
         lang = _analyze(original_tweet, has_media=has_media)["lang"]
 
     # Build refine prompt
-    prompt = build_refine_prompt(
+    system, prompt = build_refine_prompt(
         original_tweet=original_tweet,
         current_tweet=current_tweet,
         user_feedback=user_feedback,
@@ -319,7 +336,7 @@ def refine_tweet(
     )
 
     # Call Claude
-    raw_response = call_claude(prompt)
+    raw_response = call_claude(prompt, system=system)
 
     # Parse and validate
     data = parse_response(raw_response)
@@ -339,12 +356,11 @@ def refine_tweet(
 
     # Generate comparison against original
     original_analysis = analyze(original_tweet, has_media=has_media)
+    original_report = full_score_report(original_analysis, has_media=has_media)
     comp = None
     if "scores" in var:
-        comp = comparison_report(original_analysis, var["scores"], has_media=has_media)
-
-    from x_content.scorer import full_score_report
-    original_report = full_score_report(original_analysis, has_media=has_media)
+        comp = comparison_report(original_analysis, var["scores"], has_media=has_media,
+                                 original_report=original_report)
 
     return {
         "tweet": original_tweet,
@@ -381,7 +397,7 @@ def generate_discovery_tweet(
             lang = "en"
 
     # Build prompt
-    prompt = build_discovery_tweet_prompt(
+    system, prompt = build_discovery_tweet_prompt(
         trending_topic=trending_topic,
         angle=angle,
         angle_instruction=angle_instruction,
@@ -392,7 +408,7 @@ def generate_discovery_tweet(
     )
 
     # Call Claude
-    raw_response = call_claude(prompt)
+    raw_response = call_claude(prompt, system=system)
 
     # Parse and validate
     data = parse_response(raw_response)
@@ -412,7 +428,6 @@ def generate_discovery_tweet(
 
     # Score the generated tweet for a report
     generated_analysis = analyze(var.get("tweet", ""), has_media=has_media)
-    from x_content.scorer import full_score_report
     generated_report = full_score_report(generated_analysis, has_media=has_media)
 
     return {
@@ -7,21 +7,35 @@ to avoid repeated API calls.
 Dependencies:
   - twscrape (optional): pip install twscrape
   - Falls back gracefully if not installed or credentials unavailable.
+  - orjson (optional): faster profile cache serialization.
+  - fasttext (optional): pip install fasttext, plus the lid.176.ftz model
+    for batched language detection. Falls back to a heuristic detector.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
+import heapq
 import json
 import os
 import re
+import sqlite3
+import threading
 import time
 from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TypedDict
 
 from x_content import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ── Type definitions ─────────────────────────────────────────────
 
@@ -72,6 +86,25 @@ class UserProfile(TypedDict):
     posting_frequency_hours: float
     lang: str
     fetched_at: str
+    fetched_at_ts: float
+
+
+# ── Precompiled patterns ─────────────────────────────────────────
+
+_EMOJI_RE = re.compile(
+    "[\U0001f300-\U0001f9ff\U00002600-\U000027bf\U0000fe00-\U0000feff]"
+)
+_HASHTAG_RE = re.compile(r"#\w+")
+_HASHTAG_CAPTURE_RE = re.compile(r"#(\w+)")
+_URL_RE = re.compile(r"https?://\S+")
+_MENTION_TAG_RE = re.compile(r"[@#]\w+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+# ASCII characters removed by _NON_WORD_RE, for the str.translate fast path
+_ASCII_NON_WORD_TRANS = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128))
+    if not (c.isalnum() or c == "_" or c.isspace())
+))
 
 
 # ── Stopwords for topic detection ────────────────────────────────
@@ -110,19 +143,43 @@ _STOPWORDS_TR = frozenset({
 
 # ── Public API ───────────────────────────────────────────────────
 
+# Profile fields derived from the fetched tweets; fetch_profile(fields=...)
+# can restrict a live fetch to a subset of these.
+ANALYZED_FIELDS = frozenset({
+    "lang", "style", "engagement", "top_tweets", "topics",
+    "posting_frequency_hours",
+})
+
+
 def fetch_profile(
     username: str,
     force_refresh: bool = False,
+    fields: Iterable[str] | None = None,
 ) -> UserProfile | None:
     """Fetch and analyze an X user's profile.
 
     Main entry point. Returns a UserProfile dict or None on failure.
-    Uses file-based caching with configurable TTL.
+    Uses an SQLite-backed cache with configurable TTL.
 
     Args:
         username: X username (without @).
         force_refresh: Skip cache and fetch fresh data.
+        fields: Analyzed fields to compute on a live fetch (see
+            ANALYZED_FIELDS); None computes all. Skipped fields get empty
+            defaults, and such partial profiles are not written to cache.
+
+    Raises:
+        ValueError: If ``fields`` names anything not in ANALYZED_FIELDS.
     """
+    if fields is not None:
+        fields = frozenset(fields)
+        unknown = fields - ANALYZED_FIELDS
+        if unknown:
+            raise ValueError(
+                f"Unknown profile fields: {', '.join(sorted(unknown))} "
+                f"(expected any of: {', '.join(sorted(ANALYZED_FIELDS))})"
+            )
+
     username = username.lstrip("@").strip()
     if not username:
         return None
@@ -140,25 +197,139 @@ def fetch_profile(
         print(f"  \033[33mWarning: Could not fetch profile @{username}: {e}\033[0m")
         return None
 
+    return _build_fetched_profile(username, user_data, tweets, fields)
+
+
+async def fetch_profiles(
+    usernames: list[str],
+    force_refresh: bool = False,
+) -> list[UserProfile | None]:
+    """Fetch and analyze several X profiles concurrently.
+
+    Batch counterpart of fetch_profile(). Cached profiles are served from
+    the cache; the rest share one twscrape session (a single login) and
+    are fetched with at most ``profile.concurrency`` requests in flight.
+    Repeated handles (compared case-insensitively) are fetched once.
+
+    Args:
+        usernames: X usernames (with or without @).
+        force_refresh: Skip cache and fetch fresh data.
+
+    Returns:
+        One UserProfile (or None on failure) per username, in input order.
+    """
+    handles = [u.lstrip("@").strip() for u in usernames]
+
+    # Handles are case-insensitive (and so is the cache key), so each
+    # distinct handle is looked up and fetched once
+    unique: dict[str, str] = {}
+    for handle in handles:
+        if handle:
+            unique.setdefault(handle.lower(), handle)
+    profiles: dict[str, UserProfile | None] = dict.fromkeys(unique)
+
+    pending = []
+    for key, handle in unique.items():
+        if not force_refresh:
+            cached = _load_cached_profile(handle)
+            if cached is not None:
+                profiles[key] = cached
+                continue
+        pending.append(key)
+
+    if pending:
+        await _fetch_uncached_profiles(unique, pending, profiles)
+
+    # Map back to input order; repeated handles get their own copy
+    results: list[UserProfile | None] = []
+    seen: set[str] = set()
+    for handle in handles:
+        key = handle.lower()
+        profile = profiles.get(key) if handle else None
+        if profile is not None and key in seen:
+            profile = copy.deepcopy(profile)
+        seen.add(key)
+        results.append(profile)
+    return results
+
+
+async def _fetch_uncached_profiles(
+    unique: dict[str, str],
+    pending: list[str],
+    profiles: dict[str, UserProfile | None],
+) -> None:
+    """Fetch the ``pending`` handle keys over one twscrape session.
+
+    Fills ``profiles`` in place; keys that fail to fetch are left as is.
+    """
+    import asyncio
+
+    try:
+        api = await _open_twscrape_api()
+    except Exception as e:
+        print(f"  \033[33mWarning: Could not fetch profiles: {e}\033[0m")
+        return
+
+    profile_cfg = config.get("profile", {})
+    max_tweets = profile_cfg.get("max_tweets", 50)
+    semaphore = asyncio.Semaphore(max(profile_cfg.get("concurrency", 4), 1))
+
+    async def _fetch_one(key: str) -> None:
+        handle = unique[key]
+        async with semaphore:
+            try:
+                user_data, tweets = await _fetch_twscrape_user(
+                    api, handle, max_tweets,
+                )
+            except Exception as e:
+                print(f"  \033[33mWarning: Could not fetch profile @{handle}: {e}\033[0m")
+                return
+        profiles[key] = _build_fetched_profile(handle, user_data, tweets)
+
+    await asyncio.gather(*(_fetch_one(key) for key in pending))
+
+
+def _build_fetched_profile(
+    username: str,
+    user_data: dict | None,
+    tweets: list[dict],
+    fields: frozenset[str] | None = None,
+) -> UserProfile | None:
+    """Analyze freshly fetched user data and tweets, then cache the profile.
+
+    Only the analyses named in ``fields`` run (None = all); the profile is
+    cached only when every analyzed field was computed.
+    """
     if user_data is None or not tweets:
         print(f"  \033[33mWarning: No data returned for @{username}\033[0m")
         return None
 
+    if fields is None:
+        fields = ANALYZED_FIELDS
+
     # Analyze
-    from x_content.analyzer import analyze, detect_language
+    from x_content.analyzer import analyze_batch
 
     # Detect dominant language from tweets
-    lang_counts: Counter = Counter()
-    for t in tweets:
-        lang_counts[detect_language(t["text"])] += 1
-    dominant_lang = lang_counts.most_common(1)[0][0] if lang_counts else "en"
-
-    style = _analyze_style(tweets, dominant_lang)
-    engagement = _analyze_engagement(tweets, user_data.get("followers", 0))
-    top_tweets = _find_top_tweets(tweets, analyze)
-    topics = _detect_topics(tweets, dominant_lang)
-    freq = _compute_posting_frequency(tweets)
+    dominant_lang = "en"
+    if fields & {"lang", "style", "topics"}:
+        lang_counts = _count_languages([t["text"] for t in tweets])
+        dominant_lang = max(lang_counts, key=lang_counts.get) if lang_counts else "en"
+
+    style = _analyze_style(tweets if "style" in fields else [], dominant_lang)
+    engagement = _analyze_engagement(
+        tweets if "engagement" in fields else [], user_data.get("followers", 0),
+    )
+    top_tweets = (
+        _find_top_tweets(tweets, analyze_batch) if "top_tweets" in fields else []
+    )
+    topics = _detect_topics(tweets, dominant_lang) if "topics" in fields else []
+    freq = (
+        _compute_posting_frequency(tweets)
+        if "posting_frequency_hours" in fields else 0.0
+    )
 
+    now = time.time()
     profile: UserProfile = {
         "username": username,
         "followers": user_data.get("followers", 0),
@@ -172,10 +343,12 @@ def fetch_profile(
         "topics": topics,
         "posting_frequency_hours": freq,
         "lang": dominant_lang,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        "fetched_at_ts": now,
     }
 
-    _save_cached_profile(username, profile)
+    if fields >= ANALYZED_FIELDS:
+        _save_cached_profile(username, profile)
     return profile
 
 
@@ -193,15 +366,13 @@ def build_manual_profile(
     Used when twscrape/credentials are not available. The user provides
     basic stats and optionally pastes a few sample tweets for style analysis.
     """
-    from x_content.analyzer import analyze, detect_language
+    from x_content.analyzer import analyze_batch
 
     # Detect language from topics or sample tweets
     lang = "en"
     if sample_tweets:
-        lang_counts: Counter = Counter()
-        for t in sample_tweets:
-            lang_counts[detect_language(t)] += 1
-        lang = lang_counts.most_common(1)[0][0] if lang_counts else "en"
+        lang_counts = _count_languages(sample_tweets)
+        lang = max(lang_counts, key=lang_counts.get) if lang_counts else "en"
 
     # Build tweet dicts from sample tweets
     tweet_dicts = []
@@ -253,8 +424,7 @@ def build_manual_profile(
     # Top tweets from samples
     top_tweets: list[TopTweet] = []
     if sample_tweets:
-        for text in sample_tweets:
-            features = analyze(text)
+        for text, features in zip(sample_tweets, analyze_batch(sample_tweets)):
             score = int(avg_likes) + 3 * int(avg_retweets) + 5 * int(avg_replies)
             top_tweets.append(TopTweet(
                 text=text,
@@ -267,6 +437,7 @@ def build_manual_profile(
                 structural_features=features,
             ))
 
+    now = time.time()
     profile: UserProfile = {
         "username": username,
         "followers": followers,
@@ -280,7 +451,8 @@ def build_manual_profile(
         "topics": topics,
         "posting_frequency_hours": 0.0,
         "lang": lang,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        "fetched_at_ts": now,
     }
 
     _save_cached_profile(username, profile)
@@ -294,6 +466,21 @@ def _fetch_user_data(username: str) -> tuple[dict | None, list[dict]]:
 
     Returns (user_dict, tweets_list). Raises on failure.
     """
+    import asyncio
+
+    async def _fetch():
+        api = await _open_twscrape_api()
+        max_tweets = config.get("profile", {}).get("max_tweets", 50)
+        return await _fetch_twscrape_user(api, username, max_tweets)
+
+    return asyncio.run(_fetch())
+
+
+async def _open_twscrape_api():
+    """Create a twscrape API client and log in the configured account.
+
+    Raises RuntimeError if twscrape or credentials are unavailable.
+    """
     try:
         import twscrape
     except ImportError:
@@ -301,8 +488,6 @@ def _fetch_user_data(username: str) -> tuple[dict | None, list[dict]]:
             "twscrape is not installed. Install with: pip install twscrape"
         )
 
-    import asyncio
-
     creds = _load_auth_credentials()
     if not creds:
         raise RuntimeError(
@@ -331,51 +516,95 @@ def _fetch_user_data(username: str) -> tuple[dict | None, list[dict]]:
             "  Note: Use a secondary account, not your main account."
         )
 
-    async def _fetch():
-        api = twscrape.API()
+    api = twscrape.API()
 
-        await api.pool.add_account(
-            creds["username"],
-            creds["password"],
-            creds.get("email", ""),
-            creds.get("email_password", ""),
-        )
-        await api.pool.login_all()
-
-        # Get user info
-        user = await api.user_by_login(username)
-        if user is None:
-            return None, []
-
-        user_dict = {
-            "followers": user.followersCount,
-            "following": user.friendsCount,
-            "tweet_count": user.statusesCount,
-            "verified": user.verified or user.blueVerified,
-            "description": user.rawDescription or "",
-        }
+    await api.pool.add_account(
+        creds["username"],
+        creds["password"],
+        creds.get("email", ""),
+        creds.get("email_password", ""),
+    )
+    await api.pool.login_all()
+    return api
 
-        # Get recent tweets
-        max_tweets = config.get("profile", {}).get("max_tweets", 50)
-        tweets_list = []
-        async for tweet in api.user_tweets(user.id, limit=max_tweets):
-            # Skip retweets
-            if tweet.rawContent.startswith("RT @"):
-                continue
-            tweets_list.append({
-                "text": tweet.rawContent,
-                "likes": tweet.likeCount,
-                "retweets": tweet.retweetCount,
-                "replies": tweet.replyCount,
-                "quotes": tweet.quoteCount,
-                "views": tweet.viewCount or 0,
-                "bookmarks": tweet.bookmarkCount or 0,
-                "date": tweet.date.isoformat() if tweet.date else "",
-            })
 
-        return user_dict, tweets_list
+async def _fetch_twscrape_user(
+    api,
+    username: str,
+    max_tweets: int,
+) -> tuple[dict | None, list[dict]]:
+    """Fetch one user's info and recent tweets with a logged-in API client."""
+    # Get user info
+    user = await api.user_by_login(username)
+    if user is None:
+        return None, []
+
+    user_dict = {
+        "followers": user.followersCount,
+        "following": user.friendsCount,
+        "tweet_count": user.statusesCount,
+        "verified": user.verified or user.blueVerified,
+        "description": user.rawDescription or "",
+    }
 
-    return asyncio.run(_fetch())
+    # Get recent tweets. This can't be gathered with user_by_login:
+    # user_tweets needs the numeric user.id resolved above.
+    tweets_list = []
+    async for tweet in api.user_tweets(user.id, limit=max_tweets):
+        # Skip retweets
+        if tweet.rawContent.startswith("RT @"):
+            continue
+        tweets_list.append({
+            "text": tweet.rawContent,
+            "likes": tweet.likeCount,
+            "retweets": tweet.retweetCount,
+            "replies": tweet.replyCount,
+            "quotes": tweet.quoteCount,
+            "views": tweet.viewCount or 0,
+            "bookmarks": tweet.bookmarkCount or 0,
+            "date": tweet.date.isoformat() if tweet.date else "",
+            "date_ts": tweet.date.timestamp() if tweet.date else 0.0,
+        })
+
+    return user_dict, tweets_list
+
+
+# ── Language detection ───────────────────────────────────────────
+
+@functools.lru_cache(maxsize=1)
+def _get_lid_model():
+    """Load the FastText language-ID model once per process.
+
+    Returns None if fasttext is not installed or the model file is missing;
+    that outcome is cached too, so the import/load is not retried per call.
+    """
+    path = config.get("profile", {}).get("lid_model_path", "lid.176.ftz")
+    try:
+        import fasttext
+        return fasttext.load_model(path)
+    except (ImportError, ValueError, OSError):
+        return None
+
+
+def _count_languages(texts: list[str]) -> Counter:
+    """Count detected languages ('tr' or 'en') across texts.
+
+    Uses a single batched FastText predict call when available, otherwise
+    falls back to the heuristic detect_language() per text.
+    """
+    model = _get_lid_model()
+    if model is not None:
+        try:
+            labels, _ = model.predict([t.replace("\n", " ") for t in texts], k=1)
+        except ValueError:
+            pass
+        else:
+            return Counter(
+                "tr" if l[0] == "__label__tr" else "en" for l in labels
+            )
+
+    from x_content.analyzer import detect_language
+    return Counter(detect_language(t) for t in texts)
 
 
 # ── Analysis helpers ─────────────────────────────────────────────
@@ -389,30 +618,28 @@ def _analyze_style(tweets: list[dict], lang: str) -> StyleFingerprint:
             typical_tone="neutral", uses_line_breaks=False,
         )
 
-    lengths = []
-    line_counts = []
-    emoji_counts = []
-    hashtag_counts = []
-    question_counts = []
+    total_len = 0
+    total_lines = 0
+    total_emoji = 0
+    total_hashtag = 0
+    total_question = 0
 
     for t in tweets:
         text = t["text"]
-        lengths.append(len(text))
-        lines = [l for l in text.strip().split("\n") if l.strip()]
-        line_counts.append(len(lines))
-        emoji_counts.append(len(re.findall(
-            r"[\U0001f300-\U0001f9ff\U00002600-\U000027bf\U0000fe00-\U0000feff]",
-            text
-        )))
-        hashtag_counts.append(len(re.findall(r"#\w+", text)))
-        question_counts.append(text.count("?"))
+        total_len += len(text)
+        total_lines += sum(1 for l in text.strip().split("\n") if l.strip())
+        # Every emoji range is non-ASCII, so ASCII text needs no regex scan
+        if not text.isascii():
+            total_emoji += len(_EMOJI_RE.findall(text))
+        total_hashtag += len(_HASHTAG_RE.findall(text))
+        total_question += text.count("?")
 
     n = len(tweets)
-    avg_len = sum(lengths) / n
-    avg_lines = sum(line_counts) / n
-    avg_emoji = sum(emoji_counts) / n
-    avg_hashtag = sum(hashtag_counts) / n
-    avg_question = sum(question_counts) / n
+    avg_len = total_len / n
+    avg_lines = total_lines / n
+    avg_emoji = total_emoji / n
+    avg_hashtag = total_hashtag / n
+    avg_question = total_question / n
     uses_breaks = avg_lines > 1.5
 
     # Determine tone heuristically
@@ -449,12 +676,16 @@ def _analyze_engagement(
         )
 
     n = len(tweets)
-    total_likes = sum(t.get("likes", 0) for t in tweets)
-    total_rts = sum(t.get("retweets", 0) for t in tweets)
-    total_replies = sum(t.get("replies", 0) for t in tweets)
-    total_quotes = sum(t.get("quotes", 0) for t in tweets)
-    total_bookmarks = sum(t.get("bookmarks", 0) for t in tweets)
-    total_views = sum(t.get("views", 0) for t in tweets)
+    total_likes = total_rts = total_replies = 0
+    total_quotes = total_bookmarks = total_views = 0
+    for t in tweets:
+        get = t.get
+        total_likes += get("likes", 0)
+        total_rts += get("retweets", 0)
+        total_replies += get("replies", 0)
+        total_quotes += get("quotes", 0)
+        total_bookmarks += get("bookmarks", 0)
+        total_views += get("views", 0)
 
     avg_likes = total_likes / n
     avg_rts = total_rts / n
@@ -484,33 +715,36 @@ def _analyze_engagement(
     )
 
 
+def _engagement_score(t: dict) -> int:
+    """Composite engagement score: likes + 3*RTs + 5*replies + 10*quotes."""
+    return (
+        t.get("likes", 0)
+        + 3 * t.get("retweets", 0)
+        + 5 * t.get("replies", 0)
+        + 10 * t.get("quotes", 0)
+    )
+
+
 def _find_top_tweets(
     tweets: list[dict],
-    analyze_fn,
+    analyze_batch_fn,
     n: int | None = None,
 ) -> list[TopTweet]:
     """Find top-performing tweets by composite engagement score.
 
     Score formula: likes + 3*RTs + 5*replies + 10*quotes
+    Structural features for the selected tweets are computed in one
+    analyze_batch_fn call.
     """
     if n is None:
         n = config.get("profile", {}).get("top_tweets_count", 5)
 
-    scored = []
-    for t in tweets:
-        score = (
-            t.get("likes", 0)
-            + 3 * t.get("retweets", 0)
-            + 5 * t.get("replies", 0)
-            + 10 * t.get("quotes", 0)
-        )
-        scored.append((score, t))
-
-    scored.sort(key=lambda x: -x[0])
+    picked = heapq.nlargest(n, tweets, key=_engagement_score)
+    features_list = analyze_batch_fn([t["text"] for t in picked])
 
     top: list[TopTweet] = []
-    for score, t in scored[:n]:
-        features = analyze_fn(t["text"])
+    for t, features in zip(picked, features_list):
+        score = _engagement_score(t)
         top.append(TopTweet(
             text=t["text"],
             likes=t.get("likes", 0),
@@ -530,25 +764,28 @@ def _detect_topics(tweets: list[dict], lang: str) -> list[str]:
     stopwords = _STOPWORDS_TR if lang == "tr" else _STOPWORDS_EN
 
     word_counts: Counter = Counter()
+    hashtag_counts: Counter = Counter()
     for t in tweets:
-        text = t["text"].lower()
+        raw = t["text"]
+        # Also extract hashtags as topics
+        hashtag_counts.update(
+            tag.lower() for tag in _HASHTAG_CAPTURE_RE.findall(raw)
+        )
+
         # Remove URLs
-        text = re.sub(r"https?://\S+", "", text)
+        text = _URL_RE.sub("", raw.lower())
         # Remove mentions and hashtags
-        text = re.sub(r"[@#]\w+", "", text)
-        # Remove non-alphanumeric (keep Turkish chars)
-        text = re.sub(r"[^\w\s]", "", text)
-
-        words = text.split()
-        for w in words:
-            if len(w) > 2 and w not in stopwords:
-                word_counts[w] += 1
-
-    # Also extract hashtags as topics
-    hashtag_counts: Counter = Counter()
-    for t in tweets:
-        for tag in re.findall(r"#(\w+)", t["text"]):
-            hashtag_counts[tag.lower()] += 1
+        text = _MENTION_TAG_RE.sub("", text)
+        # Remove non-alphanumeric (keep Turkish chars); translate only
+        # beats the regex on pure-ASCII text
+        if text.isascii():
+            text = text.translate(_ASCII_NON_WORD_TRANS)
+        else:
+            text = _NON_WORD_RE.sub("", text)
+
+        word_counts.update(
+            w for w in text.split() if len(w) > 2 and w not in stopwords
+        )
 
     # Combine: hashtags are strong topic signals
     combined: Counter = Counter()
@@ -562,26 +799,37 @@ def _detect_topics(tweets: list[dict], lang: str) -> list[str]:
 
 def _compute_posting_frequency(tweets: list[dict]) -> float:
     """Compute average hours between tweets."""
-    dates = []
+    # Only the span matters, so track min/max epoch seconds instead of sorting
+    first = last = 0.0
+    count = 0
     for t in tweets:
-        date_str = t.get("date", "")
-        if date_str:
+        ts = t.get("date_ts")
+        if not ts:
+            # Tweets without a twscrape epoch fall back to the ISO string
+            date_str = t.get("date", "")
+            if not date_str:
+                continue
             try:
-                dt = datetime.fromisoformat(date_str)
-                dates.append(dt)
+                ts = datetime.fromisoformat(date_str).timestamp()
             except (ValueError, TypeError):
-                pass
-
-    if len(dates) < 2:
+                continue
+        if count == 0:
+            first = last = ts
+        elif ts < first:
+            first = ts
+        elif ts > last:
+            last = ts
+        count += 1
+
+    if count < 2:
         return 0.0
 
-    dates.sort()
-    total_hours = (dates[-1] - dates[0]).total_seconds() / 3600
-    return round(total_hours / (len(dates) - 1), 1)
+    return round((last - first) / 3600 / (count - 1), 1)
 
 
 # ── Credentials ──────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _load_auth_credentials() -> dict | None:
     """Load Twitter auth credentials from config, cookie file, or env vars.
 
@@ -589,6 +837,9 @@ def _load_auth_credentials() -> dict | None:
       1. config.yaml > profile > credentials
       2. .twitter_cookies JSON file
       3. Environment variables (TWITTER_USERNAME, TWITTER_PASSWORD)
+
+    The result is cached for the process lifetime; call
+    ``_load_auth_credentials.cache_clear()`` to force a reload.
     """
     # 1. config.yaml
     creds = config.get("profile", {}).get("credentials")
@@ -621,6 +872,7 @@ def _load_auth_credentials() -> dict | None:
 
 # ── Cache ────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _get_cache_dir() -> Path:
     """Get the profile cache directory, creating it if needed."""
     cache_dir = Path(config.get("profile", {}).get("cache_dir", ".cache/profiles"))
@@ -628,10 +880,107 @@ def _get_cache_dir() -> Path:
     return cache_dir
 
 
+# Serializes opening and use of the shared cache connection across threads
+_CACHE_DB_LOCK = threading.Lock()
+
+# Shared cache connection, opened on first use (None if it failed to open)
+_cache_db: sqlite3.Connection | None = None
+_cache_db_opened = False
+
+
+def _get_cache_db() -> sqlite3.Connection | None:
+    """Open the profile cache database, creating its table if needed.
+
+    All cached profiles live in a single SQLite file inside the cache
+    directory. The connection is opened once under _CACHE_DB_LOCK and
+    shared by every thread, so callers must also hold _CACHE_DB_LOCK
+    while using it. Returns None if the database cannot be opened.
+    """
+    global _cache_db, _cache_db_opened
+    if _cache_db_opened:
+        return _cache_db
+
+    with _CACHE_DB_LOCK:
+        if not _cache_db_opened:
+            try:
+                conn = sqlite3.connect(
+                    _get_cache_dir() / "profiles.db",
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS profiles ("
+                    "username TEXT PRIMARY KEY, fetched_ts REAL NOT NULL, "
+                    "data BLOB NOT NULL)"
+                )
+            except sqlite3.Error:
+                conn = None
+            _cache_db = conn
+            _cache_db_opened = True
+    return _cache_db
+
+
+# In-process memo in front of the database: lowercase username ->
+# (fetch timestamp, profile). Entries are private copies; callers only
+# ever see copies of them.
+_MEM_CACHE: dict[str, tuple[float, UserProfile]] = {}
+
+
 def _load_cached_profile(username: str) -> UserProfile | None:
-    """Load a cached profile if it exists and hasn't expired."""
-    cache_file = _get_cache_dir() / f"{username.lower()}.json"
-    if not cache_file.exists():
+    """Load a cached profile if it exists and hasn't expired.
+
+    Returns a fresh copy, so callers may modify it without affecting the cache.
+    """
+    key = username.lower()
+    ttl_hours = config.get("profile", {}).get("cache_ttl_hours", 24)
+
+    hit = _MEM_CACHE.get(key)
+    if hit is not None:
+        if time.time() - hit[0] <= ttl_hours * 3600:
+            return copy.deepcopy(hit[1])
+        del _MEM_CACHE[key]
+
+    conn = _get_cache_db()
+    if conn is None:
+        return None
+
+    # Expired rows are filtered out by the query, so they are never parsed
+    try:
+        with _CACHE_DB_LOCK:
+            row = conn.execute(
+                "SELECT fetched_ts, data FROM profiles "
+                "WHERE username = ? AND fetched_ts >= ?",
+                (key, time.time() - ttl_hours * 3600),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+
+    if row is None:
+        return _load_legacy_profile(key, ttl_hours)
+
+    try:
+        data = json.loads(row[1])
+    except ValueError:
+        return None
+
+    _MEM_CACHE[key] = (row[0], copy.deepcopy(data))
+    return data
+
+
+def _load_legacy_profile(key: str, ttl_hours: float) -> UserProfile | None:
+    """Load a fresh profile from the old one-JSON-file-per-user cache.
+
+    A hit is copied into the database so later lookups skip the file.
+    """
+    cache_file = _get_cache_dir() / f"{key}.json"
+
+    # The file was written right after fetching, so an mtime older than
+    # the TTL means the entry is expired — skip reading and parsing it
+    try:
+        mtime = cache_file.stat().st_mtime
+    except OSError:
+        return None
+    if time.time() - mtime > ttl_hours * 3600:
         return None
 
     try:
@@ -639,25 +988,49 @@ def _load_cached_profile(username: str) -> UserProfile | None:
     except (json.JSONDecodeError, OSError):
         return None
 
-    # Check TTL
-    ttl_hours = config.get("profile", {}).get("cache_ttl_hours", 24)
-    fetched_at = data.get("fetched_at", "")
-    if fetched_at:
-        try:
-            fetch_time = datetime.fromisoformat(fetched_at)
-            age_hours = (datetime.now(timezone.utc) - fetch_time).total_seconds() / 3600
-            if age_hours > ttl_hours:
-                return None  # Expired
-        except (ValueError, TypeError):
-            return None
+    # Check TTL (older cache files only carry the ISO fetched_at string)
+    fetched_at_ts = data.get("fetched_at_ts")
+    if fetched_at_ts is None:
+        fetched_at = data.get("fetched_at", "")
+        if fetched_at:
+            try:
+                fetched_at_ts = datetime.fromisoformat(fetched_at).timestamp()
+            except (ValueError, TypeError):
+                return None
+            data["fetched_at_ts"] = fetched_at_ts
+    if fetched_at_ts is not None and time.time() - fetched_at_ts > ttl_hours * 3600:
+        return None  # Expired
 
+    _save_cached_profile(key, data)
     return data
 
 
 def _save_cached_profile(username: str, profile: UserProfile) -> None:
-    """Save a profile to the cache directory."""
-    cache_file = _get_cache_dir() / f"{username.lower()}.json"
+    """Save a profile to the cache database.
+
+    The in-process memo keeps its own copy, so later changes to ``profile``
+    do not leak into the cache.
+    """
+    key = username.lower()
+    fetched_ts = profile.get("fetched_at_ts") or time.time()
+    _MEM_CACHE[key] = (fetched_ts, copy.deepcopy(profile))
+
+    conn = _get_cache_db()
+    if conn is None:
+        return
+
+    if orjson is not None:
+        payload = orjson.dumps(profile)
+    else:
+        payload = json.dumps(
+            profile, ensure_ascii=False, separators=(",", ":"),
+        ).encode("utf-8")
     try:
-        cache_file.write_text(json.dumps(profile, ensure_ascii=False, indent=2), "utf-8")
-    except OSError:
+        with _CACHE_DB_LOCK:
+            conn.execute(
+                "INSERT OR REPLACE INTO profiles (username, fetched_ts, data) "
+                "VALUES (?, ?, ?)",
+                (key, fetched_ts, payload),
+            )
+    except sqlite3.Error:
         pass  # Silently fail on write errors
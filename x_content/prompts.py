@@ -4,7 +4,8 @@ MOST CRITICAL FILE - encodes the full X algorithm knowledge into prompts
 sent to Claude Code CLI via subprocess.
 """
 
-import json
+import functools
+import re
 
 from x_content.algorithm import (
     ACTIONS, ACTION_LABELS, ACTION_WEIGHTS, NEGATIVE_ACTIONS,
@@ -118,23 +119,76 @@ You MUST respond with ONLY valid JSON, no markdown code fences, no explanation o
 """
 
 
-def _build_profile_context(user_profile: dict) -> str:
+# Optional instruction lines shared by the prompt builders
+_THREAD_INSTRUCTION = (
+    "\nOptimize as a THREAD: generate the hook tweet (first tweet) "
+    "plus 2-3 follow-up tweets that maintain engagement."
+)
+_MEDIA_INSTRUCTION = (
+    "\nThis tweet WILL include media (photo/video). Optimize text to "
+    "complement visuals and boost photo_expand_score / vqv_score."
+)
+# Extra schema field for thread output (single-variation schemas)
+_THREAD_FIELD = ',\n    "thread_tweets": ["Follow-up tweet 1", "Follow-up tweet 2"]'
+# Same field, indented for the multi-variation schema
+_SCHEMA_THREAD_FIELD = ',\n      "thread_tweets": ["Follow-up tweet 1", "Follow-up tweet 2"]'
+
+# Per-signal placeholder object used in every JSON output schema
+_SIGNALS_OBJ = ", ".join(f'"{a}": <0.0-1.0>' for a in ACTIONS)
+
+# One line per action; only the score varies between calls
+_SCORES_TEMPLATE = "\n".join(
+    f"  {a} ({ACTION_LABELS[a]}): {{:.0%}} [weight: {ACTION_WEIGHTS[a]}]"
+    f"{' (NEGATIVE)' if a in NEGATIVE_ACTIONS else ''}"
+    for a in ACTIONS
+)
+
+
+# Extra guidance appended to the TONE rule, keyed by the profile's typical tone
+_TONE_ADVICE = {
+    "professional": " Use measured, intelligent language. No slang, no hype words.",
+    "analytical": " Use measured, intelligent language. No slang, no hype words.",
+    "casual": " Use conversational, relaxed language. Can use informal phrasing.",
+    "provocative": " Be bold and direct. Challenge assumptions. Use punchy sentences.",
+    "punchy": " Keep sentences short and impactful. Get to the point fast.",
+    "humorous": " Use wit and humor. Can be sarcastic or playful.",
+}
+
+# Marker words for the top-tweet structure patterns, one scan per set
+_CONTRAST_RE = re.compile("ama |but |fakat|ancak|however")
+_EVERYONE_RE = re.compile("herkes|everyone|kimse|nobody|no one")
+
+def _build_profile_static(user_profile: dict) -> str:
     """Build a context section from user profile data for injection into prompts.
 
     Includes account overview, style fingerprint, top tweets, topics,
     algorithm-specific insights, and explicit style-matching rules.
+    Everything here is derived from the profile alone, so the block is
+    identical for every prompt built for the same author.
     """
-    parts = []
+    parts: list[str] = []
 
-    # Account overview
-    username = user_profile.get("username", "unknown")
-    followers = user_profile.get("followers", 0)
-    engagement = user_profile.get("engagement", {})
-    style = user_profile.get("style", {})
-    topics = user_profile.get("topics", [])
-    top_tweets = user_profile.get("top_tweets", [])
-    freq = user_profile.get("posting_frequency_hours", 0)
+    # Unpack everything once; the rules below only read locals
+    pg = user_profile.get
+    username, followers, verified, topics, top_tweets, freq = (
+        pg("username", "unknown"), pg("followers", 0), pg("verified"),
+        pg("topics", []), pg("top_tweets", []), pg("posting_frequency_hours", 0),
+    )
+    eg = pg("engagement", {}).get
+    avg_likes, avg_rts, avg_replies, avg_quotes, er_likes, er_rts, er_total = (
+        eg("avg_likes", 0), eg("avg_retweets", 0), eg("avg_replies", 0),
+        eg("avg_quotes", 0), eg("engagement_rate_likes", 0),
+        eg("engagement_rate_retweets", 0), eg("engagement_rate_total", 0),
+    )
+    sg = pg("style", {}).get
+    tone, avg_len, avg_lines, avg_emoji, avg_hashtag, avg_question, uses_breaks = (
+        sg("typical_tone", "neutral"), sg("avg_tweet_length", 0),
+        sg("avg_line_count", 1), sg("emoji_frequency", 0),
+        sg("hashtag_frequency", 0), sg("question_frequency", 0),
+        sg("uses_line_breaks", False),
+    )
 
+    # Account overview
     parts.append(f"## Author Profile: @{username}")
     parts.append("")
 
@@ -145,18 +199,9 @@ def _build_profile_context(user_profile: dict) -> str:
         f_str = f"{followers / 1_000:.1f}K"
     else:
         f_str = str(followers)
-    verified = "Yes" if user_profile.get("verified") else "No"
-    parts.append(f"Followers: {f_str} | Verified: {verified}")
+    parts.append(f"Followers: {f_str} | Verified: {'Yes' if verified else 'No'}")
 
     # Engagement rates
-    avg_likes = engagement.get("avg_likes", 0)
-    avg_rts = engagement.get("avg_retweets", 0)
-    avg_replies = engagement.get("avg_replies", 0)
-    avg_quotes = engagement.get("avg_quotes", 0)
-    er_likes = engagement.get("engagement_rate_likes", 0)
-    er_rts = engagement.get("engagement_rate_retweets", 0)
-    er_total = engagement.get("engagement_rate_total", 0)
-
     parts.append(
         f"Avg engagement per tweet: {avg_likes:.0f} likes, {avg_rts:.0f} RTs, "
         f"{avg_replies:.0f} replies, {avg_quotes:.0f} quotes"
@@ -167,13 +212,6 @@ def _build_profile_context(user_profile: dict) -> str:
     )
 
     # Style fingerprint
-    tone = style.get("typical_tone", "neutral")
-    avg_len = style.get("avg_tweet_length", 0)
-    avg_lines = style.get("avg_line_count", 1)
-    avg_emoji = style.get("emoji_frequency", 0)
-    avg_hashtag = style.get("hashtag_frequency", 0)
-    avg_question = style.get("question_frequency", 0)
-    uses_breaks = style.get("uses_line_breaks", False)
     parts.append(
         f"Writing style: {tone} | Avg length: {avg_len:.0f} chars | "
         f"Avg lines: {avg_lines:.1f} | "
@@ -218,27 +256,7 @@ def _build_profile_context(user_profile: dict) -> str:
     )
 
     # Tone rule
-    parts.append(f"- TONE: Write in a {tone} tone. ", )
-    if tone in ("professional", "analytical"):
-        parts.append(
-            "  Use measured, intelligent language. No slang, no hype words."
-        )
-    elif tone == "casual":
-        parts.append(
-            "  Use conversational, relaxed language. Can use informal phrasing."
-        )
-    elif tone == "provocative":
-        parts.append(
-            "  Be bold and direct. Challenge assumptions. Use punchy sentences."
-        )
-    elif tone == "punchy":
-        parts.append(
-            "  Keep sentences short and impactful. Get to the point fast."
-        )
-    elif tone == "humorous":
-        parts.append(
-            "  Use wit and humor. Can be sarcastic or playful."
-        )
+    parts.append(f"- TONE: Write in a {tone} tone.{_TONE_ADVICE.get(tone, '')}")
 
     # Length rule
     if avg_len > 0:
@@ -256,7 +274,7 @@ def _build_profile_context(user_profile: dict) -> str:
             f"- STRUCTURE: Use line breaks. Author typically writes ~{avg_lines:.0f} lines. "
             "Break content into multiple lines for readability."
         )
-    elif not uses_breaks or avg_lines <= 1.5:
+    else:
         parts.append(
             "- STRUCTURE: Keep it as a single paragraph or minimal lines. "
             "The author does NOT use multi-line formatting."
@@ -301,8 +319,10 @@ def _build_profile_context(user_profile: dict) -> str:
 
         for i, tt in enumerate(top_tweets[:3], 1):
             text = tt["text"]
-            lines = [l.strip() for l in text.split("\n") if l.strip()]
+            raw_lines = text.split("\n")
+            lines = [l.strip() for l in raw_lines if l.strip()]
             first_line = lines[0] if lines else ""
+            first_lower = first_line.lower()
 
             # Detect patterns
             patterns = []
@@ -310,7 +330,7 @@ def _build_profile_context(user_profile: dict) -> str:
             # Hook type
             if "?" in first_line:
                 patterns.append("rhetorical question hook")
-            elif "ama" in first_line.lower() or "but" in first_line.lower():
+            elif "ama" in first_lower or "but" in first_lower:
                 patterns.append("contrast/but hook")
             elif first_line.endswith(":"):
                 patterns.append("setup-colon hook (builds anticipation)")
@@ -321,7 +341,7 @@ def _build_profile_context(user_profile: dict) -> str:
 
             # Multi-line structure
             if len(lines) > 1:
-                if any(l == "" for l in text.split("\n")):
+                if "" in raw_lines:
                     patterns.append("uses blank line as pause/separator")
                 if "?" in lines[-1]:
                     patterns.append("ends with a question")
@@ -330,9 +350,9 @@ def _build_profile_context(user_profile: dict) -> str:
 
             # Contrast / opposition
             lower = text.lower()
-            if any(w in lower for w in ["ama ", "but ", "fakat", "ancak", "however"]):
+            if _CONTRAST_RE.search(lower):
                 patterns.append("uses contrast (X ama Y / X but Y)")
-            if any(w in lower for w in ["herkes", "everyone", "kimse", "nobody", "no one"]):
+            if _EVERYONE_RE.search(lower):
                 patterns.append("everyone/nobody framing")
 
             parts.append(f"  Tweet {i}: {', '.join(patterns)}")
@@ -384,7 +404,7 @@ def _build_profile_context(user_profile: dict) -> str:
         )
 
     # Filter awareness
-    if style.get("hashtag_frequency", 0) > 1.5:
+    if avg_hashtag > 1.5:
         parts.append(
             "- Filter Awareness: This author uses hashtags frequently. "
             "X's filters downrank tweets with >2 hashtags. "
@@ -406,17 +426,8 @@ def _build_profile_context(user_profile: dict) -> str:
     return "\n".join(parts)
 
 
-def _get_system_prompt(has_profile: bool = False) -> str:
-    """Get the system prompt, optionally with profile-aware instructions.
-
-    When a user profile is available, adds instructions for Claude to
-    match the author's style and leverage their engagement patterns.
-    """
-    if not has_profile:
-        return SYSTEM_PROMPT
-
-    profile_instructions = """
-
+# Appended to SYSTEM_PROMPT when a user profile is available
+_PROFILE_INSTRUCTIONS = """
 ## Author-Aware Optimization
 
 You have access to the author's profile data, engagement metrics, and top-performing tweets.
@@ -429,7 +440,93 @@ Use this information to:
 5. **OON optimization**: For reaching beyond the author's followers, prioritize signals that trigger Out-of-Network distribution: repost_score, quote_score, share_via_dm_score.
 6. **Diversity awareness**: If the author tweets frequently, each tweet must be exceptionally high-quality to overcome the Author Diversity Scorer's penalty."""
 
-    return SYSTEM_PROMPT.rstrip() + profile_instructions + "\n"
+# SYSTEM_PROMPT is kept as an exact prefix of the profile variant, so calls
+# with and without a profile share the same cached system-prompt prefix
+_SYSTEM_PROMPT_WITH_PROFILE = SYSTEM_PROMPT + _PROFILE_INSTRUCTIONS + "\n"
+
+
+def _get_system_prompt(has_profile: bool = False) -> str:
+    """Get the system prompt, optionally with profile-aware instructions.
+
+    When a user profile is available, adds instructions for Claude to
+    match the author's style and leverage their engagement patterns.
+    Both variants are built once at import.
+    """
+    return _SYSTEM_PROMPT_WITH_PROFILE if has_profile else SYSTEM_PROMPT
+
+
+def _build_system_block(
+    user_profile: dict | None = None, style_mandate: str = "",
+) -> str:
+    """Get the system prompt followed by the author's profile context.
+
+    The profile block and the style mandate only change between authors,
+    so they are kept in the cacheable system part instead of between the
+    per-tweet sections.
+    """
+    if not user_profile:
+        return _get_system_prompt(has_profile=user_profile is not None)
+    context = _build_profile_static(user_profile)
+    if not style_mandate:
+        return "\n".join((_SYSTEM_PROMPT_WITH_PROFILE, context))
+    return "\n".join((_SYSTEM_PROMPT_WITH_PROFILE, context, "", style_mandate))
+
+
+# The same tweet's analysis and scores are rendered again by later prompts
+# in a session (e.g. Phase 1 then the full optimization), so both blocks
+# are memoized on their inputs.
+@functools.lru_cache(maxsize=256, typed=True)
+def _render_analysis_summary(
+    char_count: int,
+    char_utilization: float,
+    lang: str,
+    line_count: int,
+    has_hook: bool,
+    question_count: int,
+    hashtag_count: int,
+    power_word_count: int,
+    power_words_found: tuple[str, ...],
+    has_cta: bool,
+    has_numbers: bool,
+    has_media: bool,
+    has_list_format: bool,
+) -> str:
+    """Render the structural analysis block of a prompt."""
+    return (
+        f"Characters: {char_count}/280 "
+        f"({char_utilization}% utilization)\n"
+        f"Language: {lang.upper()}\n"
+        f"Lines: {line_count}\n"
+        f"Has hook: {has_hook}\n"
+        f"Questions: {question_count}\n"
+        f"Hashtags: {hashtag_count}\n"
+        f"Power words: {power_word_count} ({', '.join(power_words_found) if power_words_found else 'none'})\n"
+        f"Has CTA: {has_cta}\n"
+        f"Has numbers/data: {has_numbers}\n"
+        f"Has media: {has_media}\n"
+        f"List format: {has_list_format}"
+    )
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _render_scores(values: tuple[float, ...]) -> str:
+    """Render the per-action score block; `values` follows ACTIONS order."""
+    return _SCORES_TEMPLATE.format(*values)
+
+
+def _render_common_sections(
+    analysis: dict, scores: dict, lang: str, has_media: bool,
+) -> tuple[str, str]:
+    """Render the analysis summary and score blocks shared by the builders."""
+    analysis_summary = _render_analysis_summary(
+        analysis["char_count"], analysis["char_utilization"], lang,
+        analysis["line_count"], analysis["has_hook"], analysis["question_count"],
+        analysis["hashtag_count"], analysis["power_word_count"],
+        tuple(analysis["power_words_found"]), analysis["has_cta"],
+        analysis["has_numbers"], has_media, analysis["has_list_format"],
+    )
+    scores_text = _render_scores(tuple(scores.get(a, 0.0) for a in ACTIONS))
+    return analysis_summary, scores_text
 
 
 def build_user_prompt(
@@ -445,46 +542,12 @@ def build_user_prompt(
 ) -> str:
     """Build the user prompt with tweet analysis and scoring data."""
 
-    # Format analysis summary
-    analysis_summary = (
-        f"Characters: {analysis['char_count']}/280 "
-        f"({analysis['char_utilization']}% utilization)\n"
-        f"Language: {lang.upper()}\n"
-        f"Lines: {analysis['line_count']}\n"
-        f"Has hook: {analysis['has_hook']}\n"
-        f"Questions: {analysis['question_count']}\n"
-        f"Hashtags: {analysis['hashtag_count']}\n"
-        f"Power words: {analysis['power_word_count']} ({', '.join(analysis['power_words_found']) if analysis['power_words_found'] else 'none'})\n"
-        f"Has CTA: {analysis['has_cta']}\n"
-        f"Has numbers/data: {analysis['has_numbers']}\n"
-        f"Has media: {has_media}\n"
-        f"List format: {analysis['has_list_format']}"
+    # Format analysis summary and current scores
+    analysis_summary, scores_text = _render_common_sections(
+        analysis, scores, lang, has_media,
     )
 
-    # Format current scores
-    score_lines = []
-    for action in ACTIONS:
-        val = scores.get(action, 0.0)
-        label = ACTION_LABELS[action]
-        weight = ACTION_WEIGHTS[action]
-        neg = " (NEGATIVE)" if action in NEGATIVE_ACTIONS else ""
-        score_lines.append(
-            f"  {action} ({label}): {val:.0%} [weight: {weight}]{neg}"
-        )
-    scores_text = "\n".join(score_lines)
-
-    # Build the output schema description
-    schema_desc = _build_schema_description(num_variations, lang, thread)
-
     topic_context = f"\nTopic/Niche: {topic}" if topic else ""
-    thread_instruction = (
-        "\nOptimize as a THREAD: generate the hook tweet (first tweet) "
-        "plus 2-3 follow-up tweets that maintain engagement."
-    ) if thread else ""
-    media_instruction = (
-        "\nThis tweet WILL include media (photo/video). Optimize text to "
-        "complement visuals and boost photo_expand_score / vqv_score."
-    ) if has_media else ""
 
     return f"""## Original Tweet
 "{tweet}"
@@ -496,7 +559,25 @@ def build_user_prompt(
 ## Current Algorithm Scores (Heuristic Estimates)
 {scores_text}
 
-## Instructions
+{_build_user_instructions(num_variations, style, lang, thread, has_media)}"""
+
+
+@functools.lru_cache(maxsize=64)
+def _build_user_instructions(
+    num_variations: int, style: str, lang: str, thread: bool, has_media: bool,
+) -> str:
+    """Build the instructions and schema tail of the user prompt.
+
+    The tail only depends on a few low-cardinality options, so each
+    combination is rendered once and reused across tweets.
+    """
+    # Build the output schema description
+    schema_desc = _build_schema_description(num_variations, lang, thread)
+
+    thread_instruction = _THREAD_INSTRUCTION if thread else ""
+    media_instruction = _MEDIA_INSTRUCTION if has_media else ""
+
+    return f"""## Instructions
 Generate exactly {num_variations} optimized variations of this tweet.
 Style/Tone: {style}
 Language: {lang.upper()} — write in {'Turkish' if lang == 'tr' else 'English'}
@@ -512,13 +593,14 @@ For each variation, estimate realistic scores (0.0-1.0) for ALL 19 signals based
 RESPOND WITH ONLY VALID JSON. No markdown fences, no text outside JSON."""
 
 
+@functools.lru_cache(maxsize=32)
 def _build_schema_description(num_variations: int, lang: str, thread: bool) -> str:
-    """Build JSON output schema description."""
-    signals_obj = ", ".join(f'"{a}": <0.0-1.0>' for a in ACTIONS)
+    """Build JSON output schema description.
 
-    thread_field = ""
-    if thread:
-        thread_field = ',\n      "thread_tweets": ["Follow-up tweet 1", "Follow-up tweet 2"]'
+    Only a handful of (num_variations, thread) combinations are used in
+    practice, so each rendered schema is built once and reused.
+    """
+    thread_field = _SCHEMA_THREAD_FIELD if thread else ""
 
     return f"""## Required JSON Output Format
 {{
@@ -528,7 +610,7 @@ def _build_schema_description(num_variations: int, lang: str, thread: bool) -> s
       "strategy": "<strategy name, e.g. 'Reply Magnet', 'Share Magnet', 'Dwell Maximizer'>",
       "char_count": <integer>,
       "targeted_signals": ["<top 3-5 signals this variation targets>"],
-      "scores": {{{signals_obj}}},
+      "scores": {{{_SIGNALS_OBJ}}},
       "media_suggestion": "<optional media/visual suggestion>",
       "explanation": "<1-2 sentences why this ranks higher>"{thread_field}
     }}
@@ -547,59 +629,25 @@ def build_preserve_style_prompt(
     has_media: bool = False,
     thread: bool = False,
     user_profile: dict | None = None,
-) -> str:
+) -> tuple[str, str]:
     """Build a prompt that optimizes the tweet while preserving its original voice and structure.
 
     This is used for Phase 1: the user gets their own tweet back, optimized
     for the algorithm but keeping the same meaning, tone, and style.
+
+    Returns:
+        (system, user) prompt pair for `call_claude`.
     """
-    # Format analysis summary
-    analysis_summary = (
-        f"Characters: {analysis['char_count']}/280 "
-        f"({analysis['char_utilization']}% utilization)\n"
-        f"Language: {lang.upper()}\n"
-        f"Lines: {analysis['line_count']}\n"
-        f"Has hook: {analysis['has_hook']}\n"
-        f"Questions: {analysis['question_count']}\n"
-        f"Hashtags: {analysis['hashtag_count']}\n"
-        f"Power words: {analysis['power_word_count']} ({', '.join(analysis['power_words_found']) if analysis['power_words_found'] else 'none'})\n"
-        f"Has CTA: {analysis['has_cta']}\n"
-        f"Has numbers/data: {analysis['has_numbers']}\n"
-        f"Has media: {has_media}\n"
-        f"List format: {analysis['has_list_format']}"
+    # Format analysis summary and current scores
+    analysis_summary, scores_text = _render_common_sections(
+        analysis, scores, lang, has_media,
     )
 
-    # Format current scores
-    score_lines = []
-    for action in ACTIONS:
-        val = scores.get(action, 0.0)
-        label = ACTION_LABELS[action]
-        weight = ACTION_WEIGHTS[action]
-        neg = " (NEGATIVE)" if action in NEGATIVE_ACTIONS else ""
-        score_lines.append(
-            f"  {action} ({label}): {val:.0%} [weight: {weight}]{neg}"
-        )
-    scores_text = "\n".join(score_lines)
-
     topic_context = f"\nTopic/Niche: {topic}" if topic else ""
-    thread_instruction = (
-        "\nOptimize as a THREAD: generate the hook tweet (first tweet) "
-        "plus 2-3 follow-up tweets that maintain engagement."
-    ) if thread else ""
-    media_instruction = (
-        "\nThis tweet WILL include media (photo/video). Optimize text to "
-        "complement visuals and boost photo_expand_score / vqv_score."
-    ) if has_media else ""
+    thread_instruction = _THREAD_INSTRUCTION if thread else ""
+    media_instruction = _MEDIA_INSTRUCTION if has_media else ""
 
-    signals_obj = ", ".join(f'"{a}": <0.0-1.0>' for a in ACTIONS)
-
-    thread_field = ""
-    if thread:
-        thread_field = ',\n    "thread_tweets": ["Follow-up tweet 1", "Follow-up tweet 2"]'
-
-    profile_context = ""
-    if user_profile:
-        profile_context = "\n" + _build_profile_context(user_profile) + "\n"
+    thread_field = _THREAD_FIELD if thread else ""
 
     user_prompt = f"""## Original Tweet
 "{tweet}"
@@ -607,7 +655,7 @@ def build_preserve_style_prompt(
 ## Structural Analysis
 {analysis_summary}
 {topic_context}
-{profile_context}
+
 ## Current Algorithm Scores (Heuristic Estimates)
 {scores_text}
 
@@ -643,7 +691,7 @@ Estimate realistic scores (0.0-1.0) for ALL 19 signals. Be honest — don't infl
       "strategy": "Preserve Style Optimization",
       "char_count": <integer>,
       "targeted_signals": ["<top 3-5 signals this targets>"],
-      "scores": {{{signals_obj}}},
+      "scores": {{{_SIGNALS_OBJ}}},
       "media_suggestion": "<optional media/visual suggestion>",
       "explanation": "<1-2 sentences explaining what was changed and why>"{thread_field}
     }}
@@ -652,13 +700,7 @@ Estimate realistic scores (0.0-1.0) for ALL 19 signals. Be honest — don't infl
 }}
 
 RESPOND WITH ONLY VALID JSON. No markdown fences, no text outside JSON."""
-
-    system = _get_system_prompt(has_profile=user_profile is not None)
-    return f"""{system}
-
----
-
-{user_prompt}"""
+    return _build_system_block(user_profile), user_prompt
 
 
 def build_refine_prompt(
@@ -669,33 +711,28 @@ def build_refine_prompt(
     has_media: bool = False,
     thread: bool = False,
     user_profile: dict | None = None,
-) -> str:
+) -> tuple[str, str]:
     """Build a prompt to refine an already-optimized tweet based on user feedback.
 
     The user has seen the AI's optimization and wants specific changes.
     Claude gets the original tweet, the current optimized version,
     and the user's instructions for what to change.
-    """
-    signals_obj = ", ".join(f'"{a}": <0.0-1.0>' for a in ACTIONS)
 
-    thread_field = ""
-    if thread:
-        thread_field = ',\n    "thread_tweets": ["Follow-up tweet 1", "Follow-up tweet 2"]'
+    Returns:
+        (system, user) prompt pair for `call_claude`.
+    """
+    thread_field = _THREAD_FIELD if thread else ""
 
     media_instruction = (
         "\nThis tweet WILL include media (photo/video). Keep text complementary to visuals."
     ) if has_media else ""
 
-    profile_context = ""
-    if user_profile:
-        profile_context = "\n" + _build_profile_context(user_profile) + "\n"
-
     user_prompt = f"""## Original Tweet (user's first input)
 "{original_tweet}"
 
 ## Current Optimized Version
 "{current_tweet}"
-{profile_context}
+
 ## User's Feedback
 The user wants the following changes applied to the CURRENT optimized version:
 "{user_feedback}"
@@ -725,7 +762,7 @@ Estimate realistic scores (0.0-1.0) for ALL 19 signals. Be honest — don't infl
       "strategy": "User Refinement",
       "char_count": <integer>,
       "targeted_signals": ["<top 3-5 signals this targets>"],
-      "scores": {{{signals_obj}}},
+      "scores": {{{_SIGNALS_OBJ}}},
       "media_suggestion": "<optional media/visual suggestion>",
       "explanation": "<1-2 sentences explaining what was changed based on user feedback>"{thread_field}
     }}
@@ -734,13 +771,7 @@ Estimate realistic scores (0.0-1.0) for ALL 19 signals. Be honest — don't infl
 }}
 
 RESPOND WITH ONLY VALID JSON. No markdown fences, no text outside JSON."""
-
-    system = _get_system_prompt(has_profile=user_profile is not None)
-    return f"""{system}
-
----
-
-{user_prompt}"""
+    return _build_system_block(user_profile), user_prompt
 
 
 def build_full_prompt(
@@ -754,11 +785,12 @@ def build_full_prompt(
     has_media: bool = False,
     thread: bool = False,
     user_profile: dict | None = None,
-) -> str:
+) -> tuple[str, str]:
     """Build complete prompt combining system + user prompts.
 
-    Since we call `claude -p`, the system prompt is embedded in the
-    single prompt string rather than sent separately.
+    Returns:
+        (system, user) prompt pair for `call_claude`. The system half holds
+        the system prompt plus the author's profile context.
     """
     user_prompt = build_user_prompt(
         tweet=tweet,
@@ -772,31 +804,17 @@ def build_full_prompt(
         thread=thread,
     )
 
-    # Inject profile context between analysis and instructions
+    # Explicit style mandate, kept next to the profile it refers to
+    style_mandate = ""
     if user_profile:
-        profile_section = "\n" + _build_profile_context(user_profile) + "\n"
-        # Add explicit style mandate in instructions
         style_mandate = (
-            f"\n\nCRITICAL: Author profile is available above. "
+            f"CRITICAL: Author profile is available above. "
             f"All variations MUST match @{user_profile.get('username', 'user')}'s "
             f"writing style. Follow the STYLE MATCHING RULES in the profile section. "
             f"Each variation should sound like the author wrote it."
         )
-        user_prompt = user_prompt.replace(
-            "\n## Current Algorithm Scores",
-            f"{profile_section}\n## Current Algorithm Scores",
-        )
-        user_prompt = user_prompt.replace(
-            "\nRESPOND WITH ONLY VALID JSON.",
-            f"{style_mandate}\n\nRESPOND WITH ONLY VALID JSON.",
-        )
-
-    system = _get_system_prompt(has_profile=user_profile is not None)
-    return f"""{system}
-
----
 
-{user_prompt}"""
+    return _build_system_block(user_profile, style_mandate), user_prompt
 
 
 def build_discovery_tweet_prompt(
@@ -807,7 +825,7 @@ def build_discovery_tweet_prompt(
     lang: str = "en",
     has_media: bool = False,
     thread: bool = False,
-) -> str:
+) -> tuple[str, str]:
     """Build a prompt to generate an optimized tweet about a trending topic.
 
     Used by the discovery flow: user picked a trending topic and an angle,
@@ -821,21 +839,17 @@ def build_discovery_tweet_prompt(
         lang: language code.
         has_media: whether tweet will include media.
         thread: whether to generate thread format.
-    """
-    signals_obj = ", ".join(f'"{a}": <0.0-1.0>' for a in ACTIONS)
 
-    thread_field = ""
-    if thread:
-        thread_field = ',\n    "thread_tweets": ["Follow-up tweet 1", "Follow-up tweet 2"]'
+    Returns:
+        (system, user) prompt pair for `call_claude`.
+    """
+    thread_field = _THREAD_FIELD if thread else ""
 
     thread_instruction = (
         "\nGenerate as a THREAD: hook tweet (first tweet) "
         "plus 2-3 follow-up tweets that maintain engagement."
     ) if thread else ""
-    media_instruction = (
-        "\nThis tweet WILL include media (photo/video). Optimize text to "
-        "complement visuals and boost photo_expand_score / vqv_score."
-    ) if has_media else ""
+    media_instruction = _MEDIA_INSTRUCTION if has_media else ""
 
     # Build topic context
     topic_name = trending_topic.get("name", "")
@@ -851,13 +865,11 @@ def build_discovery_tweet_prompt(
     if contrarian:
         topic_section += f'\nContrarian angle: {contrarian}'
 
-    # Build profile context
-    profile_context = ""
+    # Style mandate, kept next to the profile it refers to
     style_mandate = ""
     if user_profile:
-        profile_context = "\n" + _build_profile_context(user_profile) + "\n"
         style_mandate = (
-            "\n### CRITICAL: Author Style Matching\n"
+            "### CRITICAL: Author Style Matching\n"
             "You MUST write this tweet as if the author (@"
             f"{user_profile.get('username', 'user')}) wrote it themselves.\n"
             "- Study the top-performing tweets in the profile above\n"
@@ -866,20 +878,20 @@ def build_discovery_tweet_prompt(
             "(tone, length, emojis, hashtags, line breaks, hook pattern)\n"
             "- The tweet should be INDISTINGUISHABLE from the author's own writing\n"
             "- If you are unsure about the style, lean toward the patterns "
-            "visible in the top tweets\n"
+            "visible in the top tweets"
         )
 
     lang_name = 'Turkish' if lang == 'tr' else 'English'
 
     user_prompt = f"""{topic_section}
-{profile_context}
+
 ## Instructions — TRENDING TOPIC TWEET CREATION
 
 Create an original, high-quality tweet about the trending topic above.
 
 ### Angle
 {angle_instruction}
-{style_mandate}
+
 ### Rules
 - Write in {lang_name} ({lang.upper()})
 - Maximum 280 characters
@@ -902,7 +914,7 @@ Estimate realistic scores (0.0-1.0) for ALL 19 signals. Be honest.
       "strategy": "Trending Topic — {angle.title()}",
       "char_count": <integer>,
       "targeted_signals": ["<top 3-5 signals this targets>"],
-      "scores": {{{signals_obj}}},
+      "scores": {{{_SIGNALS_OBJ}}},
       "media_suggestion": "<optional media/visual suggestion>",
       "explanation": "<1-2 sentences on why this tweet will perform well>"{thread_field}
     }}
@@ -911,10 +923,4 @@ Estimate realistic scores (0.0-1.0) for ALL 19 signals. Be honest.
 }}
 
 RESPOND WITH ONLY VALID JSON. No markdown fences, no text outside JSON."""
-
-    system = _get_system_prompt(has_profile=user_profile is not None)
-    return f"""{system}
-
----
-
-{user_prompt}"""
+    return _build_system_block(user_profile, style_mandate), user_prompt
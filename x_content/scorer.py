@@ -11,6 +11,12 @@ from x_content.algorithm import (
 )
 
 
+# (action, is_negative) in ACTIONS order
+_ACTION_SIGNS: tuple[tuple[str, bool], ...] = tuple(
+    (a, a in NEGATIVE_ACTIONS) for a in ACTIONS
+)
+
+
 def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, v))
 
@@ -20,185 +26,199 @@ def score_tweet(analysis: dict) -> dict[str, float]:
 
     Uses structural features from analyzer.py and the content-to-signal
     map from algorithm.py to produce probability estimates.
+
+    Each feature is read from the analysis once and the thresholds shared
+    between signals are evaluated once, and every score is clamped to
+    [0.0, 1.0] in a single pass at the end.
     """
-    s: dict[str, float] = {}
     a = analysis  # shorthand
+    pwc = a["power_word_count"]
+    has_question = a["has_question"]
+    util = a["char_utilization"]
+    has_media = a["has_media"]
+    has_url = a["has_url"]
+    has_numbers = a["has_numbers"]
+    has_list = a["has_list_format"]
+    has_hook = a["has_hook"]
+    line_count = a["line_count"]
+    hashtag_count = a["hashtag_count"]
+
+    # Thresholds shared by several signals
+    has_power = pwc > 0
+    many_power = pwc >= 2
+    util_50 = util > 50
+    util_60 = util > 60
+    multi_line = line_count >= 3
+    many_hashtags = hashtag_count > 3
+
+    s: dict[str, float] = {}
 
     # --- POSITIVE SIGNALS ---
 
     # favorite_score: emotional resonance, power words, opinion strength
-    base_fav = 0.20
-    if a["power_word_count"] > 0:
-        base_fav += min(a["power_word_count"] * 0.08, 0.25)
-    if a["has_question"]:
-        base_fav += 0.05
+    v = 0.20
+    if has_power:
+        v += min(pwc * 0.08, 0.25)
+    if has_question:
+        v += 0.05
     if a["emoji_count"] > 0:
-        base_fav += 0.05
-    if a["char_utilization"] > 50:
-        base_fav += 0.10
-    if a["has_media"]:
-        base_fav += 0.10
-    s["favorite_score"] = _clamp(base_fav)
+        v += 0.05
+    if util_50:
+        v += 0.10
+    if has_media:
+        v += 0.10
+    s["favorite_score"] = v
 
     # reply_score: questions, debate triggers, CTAs
-    base_reply = 0.10
-    if a["has_question"]:
-        base_reply += 0.15 * min(a["question_count"], 3)
+    v = 0.10
+    if has_question:
+        v += 0.15 * min(a["question_count"], 3)
     if a["has_cta"]:
-        base_reply += 0.10
-    if a["power_word_count"] > 0:
-        base_reply += 0.08
-    if a["line_count"] >= 3:
-        base_reply += 0.05
-    s["reply_score"] = _clamp(base_reply)
+        v += 0.10
+    if has_power:
+        v += 0.08
+    if multi_line:
+        v += 0.05
+    s["reply_score"] = v
 
     # repost_score: quotable insights, data, universal truths
-    base_rt = 0.15
-    if a["has_numbers"]:
-        base_rt += 0.12
-    if a["power_word_count"] >= 2:
-        base_rt += 0.10
+    v = 0.15
+    if has_numbers:
+        v += 0.12
+    if many_power:
+        v += 0.10
     if 100 < a["char_count"] < 200:
-        base_rt += 0.08  # sweet spot for retweetability
-    if a["has_list_format"]:
-        base_rt += 0.05
-    s["repost_score"] = _clamp(base_rt)
+        v += 0.08  # sweet spot for retweetability
+    if has_list:
+        v += 0.05
+    s["repost_score"] = v
 
     # photo_expand_score
-    base_photo = 0.05
-    if a["has_media"]:
-        base_photo += 0.50
-    s["photo_expand_score"] = _clamp(base_photo)
+    s["photo_expand_score"] = 0.05 + 0.50 if has_media else 0.05
 
     # click_score: URLs, curiosity gaps
-    base_click = 0.05
-    if a["has_url"]:
-        base_click += 0.35
-    if a["power_word_count"] > 0 and a["has_url"]:
-        base_click += 0.10
-    s["click_score"] = _clamp(base_click)
+    v = 0.05
+    if has_url:
+        v += 0.35
+        if has_power:
+            v += 0.10
+    s["click_score"] = v
 
     # profile_click_score: authority, unique perspective
-    base_profile = 0.10
-    if a["power_word_count"] >= 2:
-        base_profile += 0.10
-    if a["has_numbers"]:
-        base_profile += 0.08
-    if a["char_utilization"] > 60:
-        base_profile += 0.05
-    s["profile_click_score"] = _clamp(base_profile)
+    v = 0.10
+    if many_power:
+        v += 0.10
+    if has_numbers:
+        v += 0.08
+    if util_60:
+        v += 0.05
+    s["profile_click_score"] = v
 
     # vqv_score: video content
-    base_vqv = 0.02
-    if a["has_media"]:
-        base_vqv += 0.15  # could be video
-    s["vqv_score"] = _clamp(base_vqv)
+    s["vqv_score"] = 0.02 + 0.15 if has_media else 0.02  # media could be video
 
     # share_score: useful, save-worthy content
-    base_share = 0.10
-    if a["has_list_format"]:
-        base_share += 0.15
-    if a["has_numbers"]:
-        base_share += 0.10
-    if a["power_word_count"] > 0:
-        base_share += 0.05
-    if a["char_utilization"] > 50:
-        base_share += 0.05
-    s["share_score"] = _clamp(base_share)
+    v = 0.10
+    if has_list:
+        v += 0.15
+    if has_numbers:
+        v += 0.10
+    if has_power:
+        v += 0.05
+    if util_50:
+        v += 0.05
+    s["share_score"] = v
 
     # share_via_dm_score: personal relevance, surprising, niche
-    base_dm = 0.05
-    if a["power_word_count"] >= 2:
-        base_dm += 0.12
-    if a["has_numbers"]:
-        base_dm += 0.08
-    if a["has_question"] and a["power_word_count"] > 0:
-        base_dm += 0.10
-    if a["char_utilization"] > 60:
-        base_dm += 0.05
-    s["share_via_dm_score"] = _clamp(base_dm)
+    v = 0.05
+    if many_power:
+        v += 0.12
+    if has_numbers:
+        v += 0.08
+    if has_question and has_power:
+        v += 0.10
+    if util_60:
+        v += 0.05
+    s["share_via_dm_score"] = v
 
     # share_via_copy_link_score: cross-platform value
-    base_copy = 0.05
-    if a["has_list_format"]:
-        base_copy += 0.12
-    if a["has_numbers"]:
-        base_copy += 0.08
-    if a["char_utilization"] > 70:
-        base_copy += 0.05
-    s["share_via_copy_link_score"] = _clamp(base_copy)
+    v = 0.05
+    if has_list:
+        v += 0.12
+    if has_numbers:
+        v += 0.08
+    if util > 70:
+        v += 0.05
+    s["share_via_copy_link_score"] = v
 
     # dwell_score: hook + formatting
-    base_dwell = 0.15
-    if a["has_hook"]:
-        base_dwell += 0.15
-    if a["line_count"] >= 3:
-        base_dwell += 0.10
-    if a["char_utilization"] > 50:
-        base_dwell += 0.10
-    s["dwell_score"] = _clamp(base_dwell)
+    v = 0.15
+    if has_hook:
+        v += 0.15
+    if multi_line:
+        v += 0.10
+    if util_50:
+        v += 0.10
+    s["dwell_score"] = v
 
     # quote_score: hot takes, frameworks, reaction-worthy
-    base_quote = 0.08
-    if a["power_word_count"] >= 2:
-        base_quote += 0.12
-    if a["has_numbers"]:
-        base_quote += 0.08
-    if a["has_question"]:
-        base_quote += 0.05
-    s["quote_score"] = _clamp(base_quote)
+    v = 0.08
+    if many_power:
+        v += 0.12
+    if has_numbers:
+        v += 0.08
+    if has_question:
+        v += 0.05
+    s["quote_score"] = v
 
     # quoted_click_score: low unless quoting
     s["quoted_click_score"] = 0.05
 
     # follow_author_score: expertise signals
-    base_follow = 0.08
-    if a["has_numbers"]:
-        base_follow += 0.08
-    if a["power_word_count"] >= 2:
-        base_follow += 0.08
-    if a["char_utilization"] > 60:
-        base_follow += 0.05
-    s["follow_author_score"] = _clamp(base_follow)
+    v = 0.08
+    if has_numbers:
+        v += 0.08
+    if many_power:
+        v += 0.08
+    if util_60:
+        v += 0.05
+    s["follow_author_score"] = v
 
     # --- NEGATIVE SIGNALS (lower is better) ---
 
     # not_interested_score
-    base_ni = 0.10
-    if a["hashtag_count"] > 3:
-        base_ni += 0.15
-    if a["char_utilization"] < 15:
-        base_ni += 0.10  # very short low-effort
+    v = 0.10
+    if many_hashtags:
+        v += 0.15
+    if util < 15:
+        v += 0.10  # very short low-effort
     if a["cta_count"] > 2:
-        base_ni += 0.08  # too pushy
-    s["not_interested_score"] = _clamp(base_ni)
+        v += 0.08  # too pushy
+    s["not_interested_score"] = v
 
     # block_author_score
-    base_block = 0.03
-    if a["hashtag_count"] > 5:
-        base_block += 0.05
-    s["block_author_score"] = _clamp(base_block)
+    s["block_author_score"] = 0.03 + 0.05 if hashtag_count > 5 else 0.03
 
     # mute_author_score
-    base_mute = 0.05
-    if a["hashtag_count"] > 3:
-        base_mute += 0.05
-    s["mute_author_score"] = _clamp(base_mute)
+    s["mute_author_score"] = 0.05 + 0.05 if many_hashtags else 0.05
 
     # report_score
     s["report_score"] = 0.02
 
     # dwell_time: reading duration
-    base_dwell_t = 0.15
-    if a["line_count"] >= 4:
-        base_dwell_t += 0.15
-    if a["char_utilization"] > 60:
-        base_dwell_t += 0.15
-    if a["has_hook"]:
-        base_dwell_t += 0.10
-    if a["has_list_format"]:
-        base_dwell_t += 0.10
-    s["dwell_time"] = _clamp(base_dwell_t)
+    v = 0.15
+    if line_count >= 4:
+        v += 0.15
+    if util_60:
+        v += 0.15
+    if has_hook:
+        v += 0.10
+    if has_list:
+        v += 0.10
+    s["dwell_time"] = v
+
+    for k, v in s.items():
+        s[k] = _clamp(v)
 
     return s
 
@@ -210,11 +230,12 @@ def compute_delta(original: dict[str, float],
     Returns dict mapping action -> {original, optimized, delta_pct, direction}.
     """
     result = {}
-    for action in ACTIONS:
-        orig = original.get(action, 0.0)
-        opt = optimized.get(action, 0.0)
+    orig_get = original.get
+    opt_get = optimized.get
+    for action, is_negative in _ACTION_SIGNS:
+        orig = orig_get(action, 0.0)
+        opt = opt_get(action, 0.0)
         delta_pct = ((opt - orig) / max(orig, 0.01)) * 100
-        is_negative = action in NEGATIVE_ACTIONS
         # For negative signals, decrease is an improvement
         if is_negative:
             direction = "improved" if delta_pct < 0 else "worse"
@@ -244,14 +265,25 @@ def full_score_report(analysis: dict, has_media: bool = False) -> dict:
 
 def comparison_report(original_analysis: dict,
                       optimized_scores: dict[str, float],
-                      has_media: bool = False) -> dict:
+                      has_media: bool = False,
+                      original_report: dict | None = None) -> dict:
     """Generate full comparison between original tweet and optimized variation.
 
+    When comparing several variations against the same original, pass the
+    original's `full_score_report` as `original_report` so it is scored once
+    instead of once per variation. It must be the report for
+    `original_analysis` with the same `has_media`; `original_analysis` is not
+    re-read when a report is given, so a mismatch goes undetected.
+
     Returns dict with: original (full report), optimized signals + weighted_score,
     delta (per-signal changes), weighted_score_original, weighted_score_optimized,
-    weighted_score_change.
+    weighted_score_change. When `original_report` is passed, "original" is that
+    same dict object, shared by every comparison built from it; treat it as
+    read-only.
     """
-    orig_report = full_score_report(original_analysis, has_media=has_media)
+    orig_report = original_report
+    if orig_report is None:
+        orig_report = full_score_report(original_analysis, has_media=has_media)
 
     opt_weighted = _compute_weighted(optimized_scores, has_media=has_media)
 